@@ -3,6 +3,7 @@ import os
 import dj_database_url
 
 from .settings import *  # noqa: F401,F403
+from .settings import LOGGING as BASE_LOGGING
 
 # Override Windows detection for containers
 # Check HOST_OS environment variable instead of platform.system()
@@ -40,15 +41,12 @@ STATIC_ROOT = "/app/staticfiles"
 print(f"🐳 DOCKER SETTINGS - DEBUG: {DEBUG}, DB HOST: {DATABASES['default']['HOST']}")
 
 
+# Keep the base handlers, request_id filter and formatter; only the logger
+# levels differ in containers (DEBUG is re-read from the environment above)
 LOGGING = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-        },
-    },
+    **BASE_LOGGING,
     "loggers": {
+        **BASE_LOGGING["loggers"],
         "django": {
             "handlers": ["console"],
             "level": "INFO",
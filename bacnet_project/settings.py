@@ -43,12 +43,31 @@ DEBUG = os.getenv("DEBUG", "True").lower() == "true"
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
+    "filters": {
+        "request_id": {
+            "()": "discovery.request_id.RequestIDFilter",
+        },
+    },
+    "formatters": {
+        "verbose": {
+            "format": (
+                "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] "
+                "%(message)s"
+            ),
+        },
+    },
     "handlers": {
         "console": {
             "class": "logging.StreamHandler",
+            "filters": ["request_id"],
+            "formatter": "verbose",
         },
     },
     "loggers": {
+        "discovery": {
+            "handlers": ["console"],
+            "level": "DEBUG" if DEBUG else "INFO",
+        },
         "django.utils.autoreload": {
             "level": "WARNING",  # Hide file watching spam
         },
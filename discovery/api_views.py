@@ -13,10 +13,8 @@ DRF spectacular documentation, and proper HTTP status codes.
 """
 
 from datetime import timedelta
-from typing import Any, Optional
 
-from django.db.models import Avg, Count, FloatField, Max, Min, Q
-from django.db.models.functions import Cast
+from django.db.models import Avg, Count, Max, Min
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -144,15 +142,6 @@ class DeviceTrendsAPIView(APIView):
     Get historical trends for device points
     """
 
-    def _safe_float_conversion(self, value: Any) -> Optional[float]:
-        """Safely convert value to float, return None for non-numeric values"""
-        if value is None:
-            return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-
     @extend_schema(
         summary="Get device trends",
         description=(
@@ -198,32 +187,25 @@ class DeviceTrendsAPIView(APIView):
             for point in points:
                 readings = point.readings.filter(read_time__gte=start_time)
 
-                # Filter readings to only include numeric values for statistics
-                numeric_readings = readings.exclude(
-                    Q(value__isnull=True)
-                    | Q(value__regex=r"^[^0-9\-\+\.]")
-                    | Q(  # Exclude values starting with non-numeric chars
-                        value__iexact="inactive"
-                    )
-                    | Q(value__iexact="offline")  # Explicitly exclude "inactive"
-                    | Q(value__iexact="error")  # And other common text statuses
-                )
-
-                stats = numeric_readings.aggregate(
-                    min_value=Min(Cast("value", FloatField())),
-                    max_value=Max(Cast("value", FloatField())),
-                    avg_value=Avg(Cast("value", FloatField())),
-                    count=Count("id"),
+                # value_num is null for non-numeric readings, which the
+                # aggregates skip
+                stats = readings.aggregate(
+                    min_value=Min("value_num"),
+                    max_value=Max("value_num"),
+                    avg_value=Avg("value_num"),
+                    count=Count("value_num"),
                 )
                 points_info.append(
                     {
                         "point_identifier": point.identifier,
                         "readings": [
                             {
-                                "timestamp": r.read_time.isoformat(),
-                                "value": self._safe_float_conversion(r.value),
+                                "timestamp": read_time.isoformat(),
+                                "value": value,
                             }
-                            for r in readings.order_by("read_time")
+                            for read_time, value in readings.order_by(
+                                "read_time"
+                            ).values_list("read_time", "value_num")
                         ],
                         "statistics": {
                             "min": (
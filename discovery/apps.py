@@ -4,3 +4,16 @@ from django.apps import AppConfig
 class DiscoveryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "discovery"
+
+    @property
+    def bacnet_service(self):
+        """A new BACnetService for each caller.
+
+        Not shared: the service keeps its BAC0 connection on the instance and
+        drops it when a ``with`` block exits, so two commands running in the
+        same process (e.g. under celery-beat) would disconnect each other.
+        Imported lazily so loading the app registry never pulls in BAC0.
+        """
+        from .services import BACnetService
+
+        return BACnetService()
@@ -1,3 +1,6 @@
+from types import MappingProxyType
+
+
 class BACnetConstants:
     # Time and limits
     MAX_READING_LIMIT = 50
@@ -12,47 +15,53 @@ class BACnetConstants:
     UNITS = "units"
 
     # BACnet readable object types
-    READABLE_OBJECT_TYPES = [
-        "analogInput",
-        "analogOutput",
-        "analogValue",
-        "binaryInput",
-        "binaryOutput",
-        "binaryValue",
-        "multiStateInput",
-        "multiStateOutput",
-        "multiStateValue",
-    ]
+    READABLE_OBJECT_TYPES = frozenset(
+        [
+            "analogInput",
+            "analogOutput",
+            "analogValue",
+            "binaryInput",
+            "binaryOutput",
+            "binaryValue",
+            "multiStateInput",
+            "multiStateOutput",
+            "multiStateValue",
+        ]
+    )
 
     # Object Types with Units
-    ANALOG_OBJECT_TYPES = [
-        "analogInput",
-        "analogOutput",
-        "analogValue",
-    ]
+    ANALOG_OBJECT_TYPES = frozenset(
+        [
+            "analogInput",
+            "analogOutput",
+            "analogValue",
+        ]
+    )
 
-    UNIT_CONVERSIONS = {
-        "percent": "%",
-        "percentRelativeHumidity": "% RH",
-        "degreesCelsius": "°C",
-        "degreesFahrenheit": "°F",
-        "degreesKelvin": "K",
-        "deltaDegreesKelvin": "ΔK",
-        "volts": "V",
-        "amperes": "A",
-        "kilowatts": "kW",
-        "kilowattHours": "kWh",
-        "megawattHours": "MWh",
-        "noUnits": "",
-        "litersPerSecond": "L/s",
-        "cubicMeters": "m³",
-        "cubicMetersPerSecond": "m³/s",
-        "cubicMetersPerHour": "m³/h",
-        "squareMeters": "m²",
-        "poundsMass": "lbs",
-        "kilograms": "kg",
-        "metersPerSecond": "m/s",
-    }
+    UNIT_CONVERSIONS = MappingProxyType(
+        {
+            "percent": "%",
+            "percentRelativeHumidity": "% RH",
+            "degreesCelsius": "°C",
+            "degreesFahrenheit": "°F",
+            "degreesKelvin": "K",
+            "deltaDegreesKelvin": "ΔK",
+            "volts": "V",
+            "amperes": "A",
+            "kilowatts": "kW",
+            "kilowattHours": "kWh",
+            "megawattHours": "MWh",
+            "noUnits": "",
+            "litersPerSecond": "L/s",
+            "cubicMeters": "m³",
+            "cubicMetersPerSecond": "m³/s",
+            "cubicMetersPerHour": "m³/h",
+            "squareMeters": "m²",
+            "poundsMass": "lbs",
+            "kilograms": "kg",
+            "metersPerSecond": "m/s",
+        }
+    )
 
     PERIOD_PARAMETERS = {
         "1hour": 1,
@@ -1,64 +1,79 @@
 import functools
 import logging
-import uuid
+import os
 
 from django.http import JsonResponse
-from django.utils import timezone
+from django.utils.timezone import now
 from django_ratelimit.decorators import ratelimit
 
 from .exceptions import APIError, RateLimitExceededError
+from .request_id import REQUEST_ID
+
+logger = logging.getLogger(__name__)
+
+INTERNAL_ERROR = {
+    "code": "INTERNAL_ERROR",
+    "message": "An unexpected error occurred",
+}
 
 
 def api_error_handler(view_func):
     """Decorator for consistent API error handling"""
 
+    logger = logging.getLogger(f"{view_func.__module__}.{view_func.__name__}")
+
     @functools.wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        request_id = str(uuid.uuid4())[:8]
-        logger = logging.getLogger(f"{view_func.__module__}.{view_func.__name__}")
+        token = REQUEST_ID.set(os.urandom(4).hex())
 
         try:
             logger.info(
-                f"[{request_id}] API call started",
-                extra={
-                    "request_id": request_id,
-                    "path": request.path,
-                    "method": request.method,
-                },
+                "API call started",
+                extra={"path": request.path, "method": request.method},
             )
 
-            if getattr(request, "limited", False):
-                logger.warning(f"[{request_id}] Rate limit exceeded")
-                return RateLimitExceededError().to_response()
-
             response = view_func(request, *args, **kwargs)
 
-            logger.info(f"[{request_id}] API call completed successfully")
+            logger.info("API call completed successfully")
             return response
 
         except APIError as e:
-            logger.warning(f"[{request_id}] API error: {e}")
+            logger.warning("API error: %s", e)
             return e.to_response()
         except Exception as e:
-            logger.error(f"[{request_id}] Unexpected error: {e}", exc_info=True)
+            logger.error("Unexpected error: %s", e, exc_info=True)
             return JsonResponse(
                 {
                     "success": False,
-                    "error": {
-                        "code": "INTERNAL_ERROR",
-                        "message": "An unexpected error occurred",
-                        "request_id": request_id,
-                    },
-                    "timestamp": timezone.now().isoformat(),
+                    "error": {**INTERNAL_ERROR, "request_id": REQUEST_ID.get()},
+                    "timestamp": now().isoformat(),
                 },
                 status=500,
             )
+        finally:
+            REQUEST_ID.reset(token)
 
     return wrapper
 
 
 def api_rate_limit(group=None, key=None, rate="60/h", method="POST"):
-    """Standard API rate limiting decorator"""
-    return ratelimit(
+    """Standard API rate limiting decorator
+
+    Limited requests are rejected here, before the wrapped view (and the
+    api_error_handler around it) runs.
+    """
+    limiter = ratelimit(
         group=group or "api", key=key or "ip", rate=rate, method=method, block=False
     )
+
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if getattr(request, "limited", False):
+                logger.warning("Rate limit exceeded: %s", request.path)
+                return RateLimitExceededError().to_response()
+            return view_func(request, *args, **kwargs)
+
+        return limiter(wrapper)
+
+    return decorator
@@ -1,4 +1,7 @@
-from django.http import JsonResponse
+import json
+from functools import lru_cache
+
+from django.http import HttpResponse
 from django.utils import timezone
 
 
@@ -105,20 +108,35 @@ class APIError(Exception):
     message = "An internal error occurred"
 
     def to_response(self):
-        return JsonResponse(
-            {
-                "success": False,
-                "error": {
-                    "code": self.error_code,
-                    "message": self.message,
-                    "type": self.__class__.__name__,
-                },
-                "timestamp": timezone.now().isoformat(),
-            },
-            status=self.status_code,
+        # Only class-level messages are constant; per-instance ones (such as
+        # ValidationError's) can carry request data and are built each time
+        build_prefix = (
+            _build_error_body_prefix if "message" in vars(self) else _error_body_prefix
+        )
+        body = (
+            build_prefix(self.error_code, self.message, self.__class__.__name__)
+            + json.dumps(timezone.now().isoformat()).encode()
+        )
+        return HttpResponse(
+            body + b"}", status=self.status_code, content_type="application/json"
         )
 
 
+def _build_error_body_prefix(error_code, message, error_type):
+    """Everything in an APIError body up to the timestamp value"""
+    body = json.dumps(
+        {
+            "success": False,
+            "error": {"code": error_code, "message": message, "type": error_type},
+            "timestamp": None,
+        }
+    )
+    return body[: -len("null}")].encode()
+
+
+_error_body_prefix = lru_cache(maxsize=32)(_build_error_body_prefix)
+
+
 class ValidationError(APIError):
     status_code = 400
     error_code = "VALIDATION_ERROR"
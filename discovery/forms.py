@@ -3,6 +3,7 @@ Forms for virtual device management
 """
 
 from django import forms
+from django.core.exceptions import ValidationError
 
 from .models import VirtualBACnetDevice
 
@@ -51,23 +52,18 @@ class VirtualDeviceCreateForm(forms.ModelForm):
             "port": "BACnet UDP port (default 47808)",
         }
 
-    def clean_device_id(self):
-        """Validate device_id is unique"""
-        device_id = self.cleaned_data["device_id"]
+    def validate_unique(self):
+        """Validate unique fields other than device_id.
 
-        if VirtualBACnetDevice.objects.filter(device_id=device_id).exists():
-            raise forms.ValidationError(
-                f"Device ID {device_id} already exists. Please choose a different ID."
-            )
-
-        if device_id < 0 or device_id > 4194303:
-            raise forms.ValidationError("Device ID must be between 0 and 4194303")
-        return device_id
-
-    def clean_port(self):
-        """Validate port number"""
-        port = self.cleaned_data["port"]
-
-        if port < 1024 or port > 65535:
-            raise forms.ValidationError("Port must be between 1024 and 65535")
-        return port
+        device_id uniqueness is left to the database: the service turns the
+        IntegrityError from a duplicate insert into a ValueError, which the
+        view reports on the device_id field. Checking it here as well would
+        cost an extra SELECT per submit and still race with concurrent
+        creates.
+        """
+        exclude = self._get_validation_exclusions()
+        exclude.add("device_id")
+        try:
+            self.instance.validate_unique(exclude=exclude)
+        except ValidationError as e:
+            self._update_errors(e)
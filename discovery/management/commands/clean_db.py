@@ -1,23 +1,65 @@
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 
-from discovery.models import BACnetDevice, BACnetPoint, BACnetReading
+from discovery.models import (
+    BACnetDevice,
+    BACnetPoint,
+    BACnetReading,
+    DeviceStatusHistory,
+)
+
+# Children before parents, so the non-PostgreSQL path never trips a foreign key
+DEVICE_DATA_MODELS = (BACnetReading, DeviceStatusHistory, BACnetPoint, BACnetDevice)
+COUNTED_MODELS = (BACnetReading, BACnetPoint, BACnetDevice)
 
 
 class Command(BaseCommand):
     help = "Clean all BACnet data from database"
 
     def handle(self, *args, **options):
-        reading_count = BACnetReading.objects.count()
-        point_count = BACnetPoint.objects.count()
-        device_count = BACnetDevice.objects.count()
+        # COUNT(*) is a full scan on PostgreSQL; use the planner's estimate
+        # unless exact numbers were asked for with -v 2
+        approximate = connection.vendor == "postgresql" and options["verbosity"] < 2
+
+        with transaction.atomic():
+            if approximate:
+                counts = self._estimated_counts()
+            else:
+                counts = {model: model.objects.count() for model in COUNTED_MODELS}
 
-        BACnetReading.objects.all().delete()
-        BACnetPoint.objects.all().delete()
-        BACnetDevice.objects.all().delete()
+            tables = [
+                connection.ops.quote_name(model._meta.db_table)
+                for model in DEVICE_DATA_MODELS
+            ]
+            with connection.cursor() as cursor:
+                if connection.vendor == "postgresql":
+                    cursor.execute(
+                        f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE"
+                    )
+                else:
+                    for table in tables:
+                        cursor.execute(f"DELETE FROM {table}")
 
+        prefix = "~" if approximate else ""
         self.stdout.write(
             self.style.SUCCESS(
-                f"✅ Cleaned {reading_count} readings, {point_count} points,"
-                f" {device_count} devices"
+                f"✅ Cleaned {prefix}{counts[BACnetReading]} readings,"
+                f" {prefix}{counts[BACnetPoint]} points,"
+                f" {prefix}{counts[BACnetDevice]} devices"
             )
         )
+
+    def _estimated_counts(self):
+        """Row estimates from pg_class.reltuples, one catalog lookup"""
+        tables = {model._meta.db_table: model for model in COUNTED_MODELS}
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname, reltuples::bigint FROM pg_class"
+                " WHERE relname = ANY(%s) AND relkind = 'r'",
+                [list(tables)],
+            )
+            estimates = dict(cursor.fetchall())
+        # reltuples is -1 for tables that have never been analyzed
+        return {
+            model: max(estimates.get(table, 0), 0) for table, model in tables.items()
+        }
@@ -1,7 +1,6 @@
+from django.apps import apps
 from django.core.management.base import BaseCommand
 
-from discovery.services import BACnetService
-
 
 class Command(BaseCommand):
     help = "Collect readings from all BACnet devices"
@@ -17,25 +16,26 @@ class Command(BaseCommand):
         self.stdout.write("🔄 Starting readings collection...")
 
         try:
-            service = BACnetService()
+            service = apps.get_app_config("discovery").bacnet_service
 
             if options["devices"]:
-                device_ids = [int(id.strip()) for id in options["devices"].split(",")]
+                # int() already ignores surrounding whitespace
+                device_ids = list(map(int, options["devices"].split(",")))
                 self.stdout.write(f"📋 Collecting from specific devices: {device_ids}")
-                # TODO: Implement device-specific collection if needed
-                results = service.collect_all_readings()
+                results = service.collect_all_readings(device_ids=device_ids)
             else:
                 results = service.collect_all_readings()
 
-            self.stdout.write(self.style.SUCCESS("✅ Readings collection completed"))
-
-            self.stdout.write(
-                f"📈 Readings collected: {results.get('readings_collected', 0)}"
-            )
             self.stdout.write(
-                f"🎯 Devices successful: {results.get('devices_successful', 0)}"
+                "\n".join(
+                    [
+                        self.style.SUCCESS("✅ Readings collection completed"),
+                        f"📈 Readings collected: {results.get('readings_collected', 0)}",
+                        f"🎯 Devices successful: {results.get('devices_successful', 0)}",
+                        f"❌ Devices failed: {results.get('devices_failed', 0)}",
+                    ]
+                )
             )
-            self.stdout.write(f"❌ Devices failed: {results.get('devices_failed', 0)}")
 
             return (
                 f"Completed: {results.get('readings_collected', 0)} readings collected "
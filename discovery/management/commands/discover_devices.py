@@ -1,6 +1,12 @@
+from django.apps import apps
 from django.core.management.base import BaseCommand
 
-from discovery.services import BACnetService
+
+def _id_and_address(device_info):
+    """Mock discovery yields dicts, BAC0 yields (address, device_id) tuples"""
+    if isinstance(device_info, dict):
+        return device_info["deviceId"], device_info["address"]
+    return device_info[1], device_info[0]
 
 
 class Command(BaseCommand):
@@ -17,7 +23,7 @@ class Command(BaseCommand):
         self.stdout.write("🔍 Starting device discovery...")
 
         try:
-            service = BACnetService()
+            service = apps.get_app_config("discovery").bacnet_service
             mock_mode = options.get("mock", False)
 
             if mock_mode:
@@ -32,9 +38,12 @@ class Command(BaseCommand):
                     )
                 )
 
-                for device_info in devices:
+                if devices:
                     self.stdout.write(
-                        f"📡 Found device: {device_info[1]} at {device_info[0]}"
+                        "\n".join(
+                            f"📡 Found device: {device_id} at {address}"
+                            for device_id, address in map(_id_and_address, devices)
+                        )
                     )
             else:
                 self.stdout.write(
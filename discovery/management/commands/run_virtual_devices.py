@@ -1,11 +1,16 @@
 import signal
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import BAC0
 from django.core.management.base import BaseCommand
 
 from discovery.models import VirtualBACnetDevice
 
+# BAC0.lite blocks on socket binding and the I-Am exchange, so devices on
+# separate ports are started concurrently
+MAX_START_WORKERS = 16
+
 
 class Command(BaseCommand):
     help = "Run virtual BACnet device server"
@@ -13,7 +18,7 @@ class Command(BaseCommand):
     def __init__(self):
         super().__init__()
         self.running_devices = {}  # {device_id: bacnet_instance}
-        self.shutdown = False
+        self.shutdown = threading.Event()
 
     def handle(self, *args, **options):
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -26,8 +31,8 @@ class Command(BaseCommand):
         self.start_all_devices()
 
         try:
-            while not self.shutdown:
-                time.sleep(5)
+            # wait() returns True as soon as a signal sets the event
+            while not self.shutdown.wait(timeout=5):
                 self.check_device_states()
         except KeyboardInterrupt:
             pass
@@ -36,50 +41,74 @@ class Command(BaseCommand):
 
     def start_all_devices(self):
         """Start all virtual devices from database"""
-        devices = VirtualBACnetDevice.objects.filter(is_running=True)
+        devices = VirtualBACnetDevice.objects.filter(is_running=True).only(
+            "device_id", "port"
+        )
 
-        for device in devices:
-            self.start_device(device)
+        self.start_devices(devices)
 
-    def start_device(self, device):
-        """Start a single virtual device"""
-        try:
-            self.stdout.write(f"Starting device {device.device_id}...")
+    def start_devices(self, devices):
+        """Start devices in parallel and mark the failed ones as stopped"""
+        devices = list(devices)
+        if not devices:
+            return
 
-            bacnet = BAC0.lite(deviceId=device.device_id, port=device.port)
+        for device in devices:
+            self.stdout.write(f"Starting device {device.device_id}...")
 
-            self.running_devices[device.device_id] = bacnet
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"✓ Device {device.device_id} started on port {device.port}"
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_START_WORKERS, len(devices))
+        ) as executor:
+            outcomes = list(executor.map(self.start_device, devices))
+
+        # Workers only run BAC0.lite; output, running_devices and the
+        # database are all handled here on the main thread
+        failed_ids = []
+        for device, (bacnet, error) in zip(devices, outcomes):
+            if error is None:
+                self.running_devices[device.device_id] = bacnet
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"✓ Device {device.device_id} started on port {device.port}"
+                    )
+                )
+            else:
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"✗ Failed to start device {device.device_id}: {error}"
+                    )
                 )
+                failed_ids.append(device.device_id)
+
+        if failed_ids:
+            VirtualBACnetDevice.objects.filter(device_id__in=failed_ids).update(
+                is_running=False
             )
 
+    def start_device(self, device):
+        """Start a single virtual device, returning (bacnet, error)"""
+        try:
+            return BAC0.lite(deviceId=device.device_id, port=device.port), None
         except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f"✗ Failed to start device {device.device_id}: {e}")
-            )
-            device.is_running = False
-            device.save()
+            return None, e
 
     def check_device_states(self):
         """Check if new devices should be started or stopped"""
-        should_run = set(
-            VirtualBACnetDevice.objects.filter(is_running=True).values_list(
-                "device_id", flat=True
+        should_run = {
+            device.device_id: device
+            for device in VirtualBACnetDevice.objects.filter(is_running=True).only(
+                "device_id", "port"
             )
-        )
+        }
 
         currently_running = set(self.running_devices.keys())
 
         # Start new devices
-        to_start = should_run - currently_running
-        for device_id in to_start:
-            device = VirtualBACnetDevice.objects.get(device_id=device_id)
-            self.start_device(device)
+        to_start = should_run.keys() - currently_running
+        self.start_devices(should_run[device_id] for device_id in to_start)
 
         # Stop removed devices
-        to_stop = currently_running - should_run
+        to_stop = currently_running - should_run.keys()
         for device_id in to_stop:
             self.stop_device(device_id)
 
@@ -87,8 +116,7 @@ class Command(BaseCommand):
         """Stop a single virtual devivce"""
         if device_id in self.running_devices:
             self.stdout.write(f"Stopping device {device_id}...")
-            self.running_devices[device_id].disconnect()
-            del self.running_devices[device_id]
+            self.running_devices.pop(device_id).disconnect()
             self.stdout.write(self.style.SUCCESS(f"✓ Device {device_id} stopped"))
 
     def cleanup(self):
@@ -102,4 +130,4 @@ class Command(BaseCommand):
 
     def signal_handler(self, signum, frame):
         """Handle shutdown signals"""
-        self.shutdown = True
+        self.shutdown.set()
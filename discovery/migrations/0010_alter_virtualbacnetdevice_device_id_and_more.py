@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-16 08:06
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("discovery", "0009_virtualbacnetdevice_remove_alarmhistory_device_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="virtualbacnetdevice",
+            name="device_id",
+            field=models.IntegerField(
+                help_text="BACnet device instance number (must be unique)",
+                unique=True,
+                validators=[
+                    django.core.validators.MinValueValidator(
+                        0, "Device ID must be between 0 and 4194303"
+                    ),
+                    django.core.validators.MaxValueValidator(
+                        4194303, "Device ID must be between 0 and 4194303"
+                    ),
+                ],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="virtualbacnetdevice",
+            name="port",
+            field=models.IntegerField(
+                default=47808,
+                help_text="BACnet UDP port (default 47808)",
+                validators=[
+                    django.core.validators.MinValueValidator(
+                        1024, "Port must be between 1024 and 65535"
+                    ),
+                    django.core.validators.MaxValueValidator(
+                        65535, "Port must be between 1024 and 65535"
+                    ),
+                ],
+            ),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.6 on 2026-10-16 08:11
+
+import math
+
+from django.db import migrations, models
+
+# At most two exponent digits: value is capped at 100 characters, so every
+# match stays inside double precision and the SQL cast cannot overflow
+NUMERIC_PATTERN = r"^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]{1,2})?\s*$"
+LONG_EXPONENT_PATTERN = r"[eE][-+]?[0-9]{3,}\s*$"
+
+
+def _to_float(value):
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _populate_in_python(readings):
+    batch = []
+    for reading in readings.only("pk", "value").iterator(2000):
+        reading.value_num = _to_float(reading.value)
+        if reading.value_num is not None:
+            batch.append(reading)
+        if len(batch) >= 2000:
+            type(reading).objects.bulk_update(batch, ["value_num"])
+            batch = []
+    if batch:
+        type(batch[0]).objects.bulk_update(batch, ["value_num"])
+
+
+def populate_value_num(apps, schema_editor):
+    BACnetReading = apps.get_model("discovery", "BACnetReading")
+    if schema_editor.connection.vendor != "postgresql":
+        _populate_in_python(BACnetReading.objects.all())
+        return
+
+    BACnetReading.objects.filter(value__regex=NUMERIC_PATTERN).update(
+        value_num=models.functions.Cast("value", models.FloatField())
+    )
+    # Rare long exponents (1e400, 1e-400) would overflow the cast
+    _populate_in_python(
+        BACnetReading.objects.filter(value__regex=LONG_EXPONENT_PATTERN)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("discovery", "0010_alter_virtualbacnetdevice_device_id_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="bacnetreading",
+            name="discovery_b_point_i_cf9262_idx",
+        ),
+        migrations.AddField(
+            model_name="bacnetreading",
+            name="value_num",
+            field=models.FloatField(
+                blank=True,
+                help_text="Numeric reading value (null for non-numeric readings)",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(populate_value_num, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="bacnetreading",
+            index=models.Index(
+                fields=["point", "-read_time"],
+                include=("value_num",),
+                name="reading_pt_time_val_ix",
+            ),
+        ),
+    ]
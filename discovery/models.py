@@ -16,6 +16,8 @@ The schema is designed for:
 - Simple connectivity monitoring
 """
 
+import math
+
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils import timezone
@@ -23,6 +25,15 @@ from django.utils import timezone
 from .constants import BACnetConstants
 
 
+def numeric_value(value):
+    """Return a reading value as a float, or None if it is not a finite number"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
 class BACnetDevice(models.Model):
     device_id = models.IntegerField(
         unique=True, help_text="BACnet device instance number"
@@ -49,7 +60,7 @@ class BACnetDevice(models.Model):
     def mark_seen(self):
         self.last_seen = timezone.now()
         self.is_online = True
-        self.save()
+        self.save(update_fields=["last_seen", "is_online"])
 
 
 class BACnetPoint(models.Model):
@@ -112,27 +123,27 @@ class BACnetPoint(models.Model):
 
     def update_value(self, value, units=None, data_type=None):
         self.present_value = str(value)
+        self.value_last_read = timezone.now()
+        update_fields = ["present_value", "value_last_read"]
         if units:
             self.units = units
+            update_fields.append("units")
         if data_type:
             self.data_type = data_type
-        self.value_last_read = timezone.now()
-        self.save()
+            update_fields.append("data_type")
+        self.save(update_fields=update_fields)
 
     def get_display_value(self):
-        if self.present_value is None or self.present_value == "":
-            return "N/A"
-
+        # present_value is a CharField, so it is always a string here
         value = self.present_value
+        if not value:
+            return "N/A"
 
-        if isinstance(self.present_value, float):
-            value = f"{self.present_value:.2f}"
-        elif isinstance(self.present_value, (int, str)) and "." in str(
-            self.present_value
-        ):
-            value = f"{float(self.present_value):.2f}"
-        else:
-            value = str(value)
+        if "." in value:
+            try:
+                value = f"{float(value):.2f}"
+            except ValueError:
+                pass
 
         if self.units:
             converted_units = BACnetConstants.UNIT_CONVERSIONS.get(
@@ -156,6 +167,11 @@ class BACnetReading(models.Model):
     )
 
     value = models.CharField(max_length=100, help_text="Sensor reading value")
+    value_num = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Numeric reading value (null for non-numeric readings)",
+    )
     units = models.CharField(max_length=50, blank=True, help_text="Engineering units")
     read_time = models.DateTimeField(
         default=timezone.now, help_text="When reading was taken"
@@ -171,7 +187,13 @@ class BACnetReading(models.Model):
         verbose_name = "BACnet Reading"
         verbose_name_plural = "BACnet Readings"
         indexes = [
-            models.Index(fields=["point", "-read_time"]),
+            # Covers the trends queries (point + time range, numeric value)
+            # so they can be answered from the index alone
+            models.Index(
+                fields=["point", "-read_time"],
+                include=["value_num"],
+                name="reading_pt_time_val_ix",
+            ),
         ]
 
     def __str__(self):
@@ -181,6 +203,14 @@ class BACnetReading(models.Model):
         """
         return msg
 
+    def save(self, *args, **kwargs):
+        # Derived from value on every save so edits never leave it stale
+        self.value_num = numeric_value(self.value)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "value" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "value_num"}
+        super().save(*args, **kwargs)
+
     def get_display_value(self):
         if self.units:
             return f"{self.value} {self.units}"
@@ -218,7 +248,12 @@ class VirtualBACnetDevice(models.Model):
 
     # Core device info
     device_id = models.IntegerField(
-        unique=True, help_text="BACnet device instance number (must be unique)"
+        unique=True,
+        validators=[
+            MinValueValidator(0, "Device ID must be between 0 and 4194303"),
+            MaxValueValidator(4194303, "Device ID must be between 0 and 4194303"),
+        ],
+        help_text="BACnet device instance number (must be unique)",
     )
     device_name = models.CharField(
         max_length=200, help_text="Human-readable device name"
@@ -229,7 +264,12 @@ class VirtualBACnetDevice(models.Model):
 
     # Network configuration
     port = models.IntegerField(
-        default=47808, help_text="BACnet UDP port (default 47808)"
+        default=47808,
+        validators=[
+            MinValueValidator(1024, "Port must be between 1024 and 65535"),
+            MaxValueValidator(65535, "Port must be between 1024 and 65535"),
+        ],
+        help_text="BACnet UDP port (default 47808)",
     )
 
     # Status tracking
@@ -0,0 +1,19 @@
+"""
+Request ID tracking for API logging.
+
+api_error_handler stores a short id for each API call in REQUEST_ID, and
+RequestIDFilter copies it onto every log record emitted while that call is
+being handled, so log lines can be correlated without threading the id
+through each message.
+"""
+
+import logging
+from contextvars import ContextVar
+
+REQUEST_ID = ContextVar("request_id", default="-")
+
+
+class RequestIDFilter(logging.Filter):
+    def filter(self, record):
+        record.request_id = REQUEST_ID.get()
+        return True
@@ -24,6 +24,7 @@ import logging
 import os
 
 import BAC0
+from django.db.models import Prefetch
 from django.utils import timezone
 
 from .constants import BACnetConstants
@@ -41,10 +42,6 @@ from .models import (
     DeviceStatusHistory,
 )
 
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(name)s = %(levelname)s - %(message)s"
-)
-
 logging.getLogger("BAC0_Root").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
@@ -101,7 +98,7 @@ class BACnetService:
             # Use specific IP if provided in environment
             bacnet_ip = os.getenv("BACNET_IP")
             if bacnet_ip:
-                self._log(f"🎯 Using specified IP: {bacnet_ip}")
+                self._log("🎯 Using specified IP: %s", bacnet_ip)
 
                 # Parse IP and port from BACNET_IP (format: IP:PORT/MASK)
                 if ":" in bacnet_ip and "/" in bacnet_ip:
@@ -110,7 +107,7 @@ class BACnetService:
                     ip_address, port = ip_part.split(":")
                     ip_with_mask = f"{ip_address}/{mask_part}"
                     port = int(port)
-                    self._log(f"🔧 Parsed - IP: {ip_with_mask}, Port: {port}")
+                    self._log("🔧 Parsed - IP: %s, Port: %s", ip_with_mask, port)
 
                     self.bacnet = BAC0.lite(ip=ip_with_mask, port=port)
                 else:
@@ -149,7 +146,7 @@ class BACnetService:
                     ):
                         self.bacnet.task_manager.stop()
                 except Exception as e:
-                    logger.debug(f"Task manager stop error (harmless): {e}")
+                    logger.debug("Task manager stop error (harmless): %s", e)
 
                 # Disconnect BAC0
                 self.bacnet.disconnect()
@@ -167,24 +164,25 @@ class BACnetService:
             self.bacnet = None
 
         except (OSError, AttributeError) as e:
-            logger.debug(f"Cleanup error during disconnect (harmless): {e}")
+            logger.debug("Cleanup error during disconnect (harmless): %s", e)
         except Exception as e:
-            logger.debug(f"Other cleanup error (harmless): {e}")
+            logger.debug("Other cleanup error (harmless): %s", e)
         finally:
             # Ensure bacnet is set to None regardless
             self.bacnet = None
 
-    def _log(self, message, level="info"):
+    def _log(self, message, *args, level="info"):
         """
         Log message and optionally call callback for interactive mode.
 
         Args:
-            message (str): Message to log and send to callback
+            message (str): %-style message to log and send to callback
+            args: Arguments for message, formatted only when needed
             level (str): Log level (default: "info")
         """
-        getattr(logger, level)(message)
+        getattr(logger, level)(message, *args)
         if self.callback:
-            self.callback(message)
+            self.callback(message % args if args else message)
 
     def discover_devices(self, network="192.168.1.0/24", timeout=10, mock_mode=False):
         """
@@ -211,26 +209,10 @@ class BACnetService:
                     {"deviceId": 456, "address": "192.168.1.101", "vendorId": 25},
                 ]
 
-                for device_info in devices:
-                    device, created = BACnetDevice.objects.get_or_create(
-                        device_id=device_info["deviceId"],
-                        defaults={
-                            "address": str(device_info["address"]),
-                            "vendor_id": device_info["vendorId"],
-                            "is_online": True,
-                            "last_seen": timezone.now(),
-                        },
-                    )
-
-                    DeviceStatusHistory.objects.create(
-                        device=device, is_online=True, timestamp=timezone.now()
-                    )
-
-                    self._log(
-                        f"{'Created' if created else 'Updated'} device "
-                        f"{device_info['deviceId']}"
-                    )
-                self._log(f"✅ Found {len(devices)} devices (mock)")
+                self._upsert_discovered_devices(
+                    (d["deviceId"], str(d["address"]), d["vendorId"]) for d in devices
+                )
+                self._log("✅ Found %s devices (mock)", len(devices))
 
                 return devices
 
@@ -240,65 +222,16 @@ class BACnetService:
                 devices = self.bacnet.discover()
 
                 if devices is not None:
-                    existing_device_ids = set(
-                        BACnetDevice.objects.filter(
-                            device_id__in=[device_info[1] for device_info in devices]
-                        ).values_list("device_id", flat=True)
-                    )
-                    devices_to_create = []
-                    history_records = []
-                    for device_info in devices:
-                        device_id = device_info[1]
-                        if device_id not in existing_device_ids:
-                            devices_to_create.append(
-                                BACnetDevice(
-                                    device_id=device_id,
-                                    address=str(device_info[0]),
-                                    vendor_id=getattr(
-                                        device_info,
-                                        BACnetConstants.VENDOR_IDENTIFIER,
-                                        0,
-                                    ),
-                                    is_online=True,
-                                    last_seen=timezone.now(),
-                                )
-                            )
-                    existing_devices = BACnetDevice.objects.filter(
-                        device_id__in=existing_device_ids
-                    )
-                    device_info_map = {
-                        device_info[1]: device_info for device_info in devices
-                    }
-
-                    for device in existing_devices:
-                        device_info = device_info_map[device.device_id]
-                        device.address = str(device_info[0])
-                        device.is_online = True
-                        device.is_active = True
-                        device.last_seen = timezone.now()
-
-                    if devices_to_create:
-                        BACnetDevice.objects.bulk_create(devices_to_create)
-
-                    if existing_devices:
-                        BACnetDevice.objects.bulk_update(
-                            existing_devices,
-                            fields=["address", "is_online", "is_active", "last_seen"],
+                    self._upsert_discovered_devices(
+                        (
+                            device_info[1],
+                            str(device_info[0]),
+                            getattr(device_info, BACnetConstants.VENDOR_IDENTIFIER, 0),
                         )
-
-                    all_devices = BACnetDevice.objects.filter(
-                        device_id__in=[device_info[1] for device_info in devices]
+                        for device_info in devices
                     )
-                    history_records = [
-                        DeviceStatusHistory(
-                            device=device, is_online=True, timestamp=timezone.now()
-                        )
-                        for device in all_devices
-                    ]
-
-                    DeviceStatusHistory.objects.bulk_create(history_records)
 
-                    self._log(f"✅ Found {len(devices)} devices (real)")
+                    self._log("✅ Found %s devices (real)", len(devices))
                 else:
                     self._log("✅ Found 0 devices")
 
@@ -306,9 +239,49 @@ class BACnetService:
         except (OSError, ConnectionError) as e:
             raise BACnetConnectionError(f"Device discovery connection failed: {e}")
         except Exception as e:
-            logger.error(f"Device discovery failed: {e}")
+            logger.error("Device discovery failed: %s", e)
             raise BACnetServiceError(f"Device discovery failed: {e}")
 
+    def _upsert_discovered_devices(self, rows):
+        """Insert or refresh discovered devices with one upsert per batch.
+
+        Args:
+            rows: iterable of (device_id, address, vendor_id) tuples
+        """
+        now = timezone.now()
+        devices = [
+            BACnetDevice(
+                device_id=device_id,
+                address=address,
+                vendor_id=vendor_id,
+                is_online=True,
+                is_active=True,
+                last_seen=now,
+            )
+            for device_id, address, vendor_id in rows
+        ]
+        if not devices:
+            return
+
+        BACnetDevice.objects.bulk_create(
+            devices,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["device_id"],
+            update_fields=["address", "is_online", "is_active", "last_seen"],
+        )
+
+        device_pks = BACnetDevice.objects.filter(
+            device_id__in=[device.device_id for device in devices]
+        ).values_list("pk", flat=True)
+        DeviceStatusHistory.objects.bulk_create(
+            [
+                DeviceStatusHistory(device_id=pk, is_online=True, timestamp=now)
+                for pk in device_pks
+            ],
+            batch_size=500,
+        )
+
     def read_device_property(self, device, property_name):
         try:
             read_string = f"{device.address} device {device.device_id} {property_name}"
@@ -317,7 +290,9 @@ class BACnetService:
         except (OSError, AttributeError) as e:
             raise BACnetPropertyReadError(device.device_id, property_name, e)
         except Exception as e:
-            self._log(f"⚠️ Could not read {property_name} from {device.device_id}: {e}")
+            self._log(
+                "⚠️ Could not read %s from %s: %s", property_name, device.device_id, e
+            )
             raise BACnetPropertyReadError(device.device_id, property_name, e)
 
     def discover_device_points(self, device):
@@ -333,38 +308,30 @@ class BACnetService:
                 )
                 if vendor_id:
                     device.vendor_id = vendor_id
-                    device.save()
-                    self._log(f"📋 Updated vendor ID: {vendor_id}")
+                    device.save(update_fields=["vendor_id"])
+                    self._log("📋 Updated vendor ID: %s", vendor_id)
 
                 point_list = self.read_device_property(
                     device, BACnetConstants.OBJECT_LIST
                 )
 
-                for point in point_list:
-                    try:
-                        self._log(f"Creating point: {point}")
-                        self._log(
-                            f"Point attributes: object_type={point[0]},"
-                            f" instance={point[1]}"
-                        )
-                        object_type = point[0]
-                        instance_number = point[1]
-
-                        BACnetPoint.objects.get_or_create(
+                BACnetPoint.objects.bulk_create(
+                    [
+                        BACnetPoint(
                             device=device,
                             object_type=object_type,
                             instance_number=instance_number,
                             identifier=f"{object_type}:{instance_number}",
-                            # defaults={
-                            #     value_last_read=timezone.now()
-                            # }
                         )
-                    except Exception as e:
-                        logger.error(f"Error {e}")
-                        self._log(f"Failed point data: {point}")
+                        for object_type, instance_number in point_list
+                    ],
+                    ignore_conflicts=True,
+                    batch_size=1000,
+                )
+                self._log("Saved %s points", len(point_list))
 
+                BACnetDevice.objects.filter(pk=device.pk).update(points_read=True)
                 device.points_read = True
-                device.save()
 
                 return point_list
 
@@ -375,7 +342,9 @@ class BACnetService:
                 device.device_id, "Point discovery connection failed", e
             )
         except Exception as e:
-            logger.error(f"Point discovery failed for device {device.device_id}: {e}")
+            logger.error(
+                "Point discovery failed for device %s: %s", device.device_id, e
+            )
             raise BACnetDeviceError(device.device_id, f"Point discovery failed: {e}", e)
 
     def read_point_value(self, device, point):
@@ -391,7 +360,7 @@ class BACnetService:
                     f"{device.address} {point.object_type} "
                     f"{point.instance_number} {BACnetConstants.PRESENT_VALUE}"
                 )
-                self._log(f"📖 Reading {point.identifier}")
+                self._log("📖 Reading %s", point.identifier)
                 value = self.bacnet.read(read_string)
 
                 return value
@@ -404,8 +373,10 @@ class BACnetService:
             )
         except Exception as e:
             logger.error(
-                f"Failed to read point {point.identifier} "
-                f"from device {device.device_id}: {e}"
+                "Failed to read point %s from device %s: %s",
+                point.identifier,
+                device.device_id,
+                e,
             )
             raise BACnetDeviceError(
                 device.device_id, f"Failed to read point {point.identifier}", e
@@ -431,21 +402,24 @@ class BACnetService:
                 f"{device.address} {point.object_type} "
                 f"{point.instance_number} {BACnetConstants.PRESENT_VALUE}"
             )
-            self._log(f"📖 Reading {point.identifier}")
+            self._log("📖 Reading %s", point.identifier)
             value = self.bacnet.read(read_string)
             if value is not None:
                 self._create_reading(point, value)
                 results["readings_collected"] += 1
 
         except Exception as e:
-            self._log(f"❌ Failed to read {point.identifier}: {e}")
+            self._log("❌ Failed to read %s: %s", point.identifier, e)
 
     def read_device_points(self, device, results):
         try:
-            self._log(f"📖 Reading from device {device.device_id}")
-            readable_points = device.points.filter(
-                object_type__in=BACnetConstants.READABLE_OBJECT_TYPES
-            )
+            self._log("📖 Reading from device %s", device.device_id)
+            # Devices from _get_online_devices() carry a prefetched subset
+            readable_points = getattr(device, "readable_points", None)
+            if readable_points is None:
+                readable_points = device.points.filter(
+                    object_type__in=BACnetConstants.READABLE_OBJECT_TYPES
+                )
 
             if not self._read_device_points_batch(device, readable_points, results):
                 for point in readable_points:
@@ -453,7 +427,7 @@ class BACnetService:
 
         except Exception as e:
             results["devices_failed"] += 1
-            self._log(f"❌ Device {device.device_id} failed: {e}")
+            self._log("❌ Device %s failed: %s", device.device_id, e)
 
     def _build_batch_request(self, device, points_list):
         request_parts = [device.address]
@@ -497,12 +471,15 @@ class BACnetService:
                 self._create_reading(point, present_value)
 
                 point.present_value = str(present_value)
+                point.value_last_read = timezone.now()
+                update_fields = ["present_value", "value_last_read"]
                 if object_name:
                     point.object_name = str(object_name)
+                    update_fields.append("object_name")
                 if units:
                     point.units = str(units)
-                point.value_last_read = timezone.now()
-                point.save()
+                    update_fields.append("units")
+                point.save(update_fields=update_fields)
                 results["readings_collected"] += 1
         return results
 
@@ -515,20 +492,21 @@ class BACnetService:
             expected_values = self._calculate_expected_values(points_list)
 
             if values and len(values) == expected_values:
-                self._log(f"✅ Batch read successful: {len(values)} values")
+                self._log("✅ Batch read successful: %s values", len(values))
 
                 self._process_batch_results(points_list, values, results)
                 return True
             else:
                 self._log(
-                    f"⚠️ Batch read mismatch: got {len(values) if values else 0} "
-                    f"values for {len(points_list)} points"
+                    "⚠️ Batch read mismatch: got %s values for %s points",
+                    len(values) if values else 0,
+                    len(points_list),
                 )
             return False
         except (OSError, ConnectionError) as e:
             raise BACnetBatchReadError(device.device_id, len(points_list), e)
         except Exception as e:
-            self._log(f"❌ Batch read failed: {e}")
+            self._log("❌ Batch read failed: %s", e)
             raise BACnetBatchReadError(device.device_id, len(points_list), e)
 
     def _read_device_points_in_chunks(self, device, points_list, results):
@@ -536,28 +514,32 @@ class BACnetService:
             chunk_size = MAX_BATCH_SIZE
             total_chunks = (len(points_list) + chunk_size - 1) // chunk_size
             self._log(
-                f"📦 Large device: splitting {len(points_list)} "
-                f"points into {total_chunks} chunks of {chunk_size}"
+                "📦 Large device: splitting %s points into %s chunks of %s",
+                len(points_list),
+                total_chunks,
+                chunk_size,
             )
 
             for i in range(0, len(points_list), chunk_size):
                 chunk = points_list[i : i + chunk_size]
                 self._log(
-                    f"📦 Processing chunk {i//chunk_size + 1}/{total_chunks} "
-                    f"({len(chunk)} points)"
+                    "📦 Processing chunk %s/%s (%s points)",
+                    i // chunk_size + 1,
+                    total_chunks,
+                    len(chunk),
                 )
 
                 try:
                     if not self._read_single_batch_chunk(device, chunk, results):
                         self._log(
-                            f"⚠️ Chunk {i//chunk_size + 1} failed, falling back to "
-                            f"individual reads"
+                            "⚠️ Chunk %s failed, falling back to individual reads",
+                            i // chunk_size + 1,
                         )
 
                         for point in chunk:
                             self._read_single_point(device, point, results)
                 except BACnetBatchReadError as e:
-                    self._log(f"⚠️ Chunk {i//chunk_size + 1} failed: {e}")
+                    self._log("⚠️ Chunk %s failed: %s", i // chunk_size + 1, e)
 
             return True
         except (OSError, ConnectionError) as e:
@@ -565,7 +547,7 @@ class BACnetService:
                 device.device_id, "Chunked read connection failed", e
             )
         except Exception as e:
-            self._log(f"❌ Chunked batch read failed: {e}")
+            self._log("❌ Chunked batch read failed: %s", e)
             raise BACnetDeviceError(device.device_id, "Chunked read failed", e)
 
     def _read_single_batch_chunk(self, device, chunk_points, results):
@@ -588,34 +570,53 @@ class BACnetService:
             "timestamp": timezone.now(),
         }
 
-    def _get_online_devices(self):
+    def _get_online_devices(self, device_ids=None):
         online_devices = BACnetDevice.objects.filter(is_online=True)
-        self._log(f"📊 Found {online_devices.count()} online devices")
+        if device_ids is not None:
+            online_devices = online_devices.filter(device_id__in=device_ids)
+        online_devices = online_devices.prefetch_related(
+            Prefetch(
+                "points",
+                queryset=BACnetPoint.objects.filter(
+                    object_type__in=BACnetConstants.READABLE_OBJECT_TYPES
+                ),
+                to_attr="readable_points",
+            )
+        )
+        self._log("📊 Found %s online devices", online_devices.count())
         return online_devices
 
-    def collect_all_readings(self):
+    def collect_all_readings(self, device_ids=None):
         """
         Collect current readings from all online BACnet devices
         and save to database.
 
+        Args:
+            device_ids (list): Only collect from these device IDs
+            (default: all online devices)
+
         Returns:
             dict: Summary of collection results with devices_processed,
-            readings_collected, etc.
+            devices_successful, devices_failed, readings_collected, etc.
 
         Raises:
             Exception: BACnet connection or database errors
 
         """
         results = self._initialise_results()
-        online_devices = self._get_online_devices()
+        online_devices = self._get_online_devices(device_ids)
 
         with self:
             for device in online_devices:
                 self.read_device_points(device, results)
                 results["devices_processed"] += 1
+            results["devices_successful"] = (
+                results["devices_processed"] - results["devices_failed"]
+            )
 
             self._log(
-                f"✅ Collected {results['readings_collected']} readings "
-                f"from {results['devices_processed']} devices"
+                "✅ Collected %s readings from %s devices",
+                results["readings_collected"],
+                results["devices_processed"],
             )
             return results
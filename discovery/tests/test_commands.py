@@ -0,0 +1,101 @@
+from io import StringIO
+from unittest import skipUnless
+from unittest.mock import Mock, patch
+
+from django.core.management import call_command
+from django.db import connection
+
+from discovery.management.commands.run_virtual_devices import (
+    Command as RunVirtualDevicesCommand,
+)
+from discovery.models import (
+    BACnetDevice,
+    BACnetPoint,
+    BACnetReading,
+    DeviceStatusHistory,
+    VirtualBACnetDevice,
+)
+
+from .test_base import BACnetDeviceFactory, BaseTestCase
+
+
+class TestCleanDbCommand(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        BACnetReading.objects.create(point=self.point, value="21.5")
+        DeviceStatusHistory.objects.create(device=self.device, is_online=True)
+
+    def _clean(self, **options):
+        out = StringIO()
+        call_command("clean_db", stdout=out, **options)
+        return out.getvalue()
+
+    def _assert_tables_empty(self):
+        for model in (BACnetReading, DeviceStatusHistory, BACnetPoint, BACnetDevice):
+            self.assertFalse(model.objects.exists(), model.__name__)
+
+    def test_delete_path_reports_exact_counts(self):
+        with patch.object(connection, "vendor", "sqlite"):
+            output = self._clean()
+
+        self.assertIn("Cleaned 1 readings, 1 points, 1 devices", output)
+        self._assert_tables_empty()
+
+    @skipUnless(connection.vendor == "postgresql", "TRUNCATE path is PostgreSQL-only")
+    def test_truncate_path_reports_estimates(self):
+        output = self._clean()
+
+        self.assertIn("readings, ~", output)
+        self._assert_tables_empty()
+
+    @skipUnless(connection.vendor == "postgresql", "TRUNCATE path is PostgreSQL-only")
+    def test_truncate_path_reports_exact_counts_when_verbose(self):
+        output = self._clean(verbosity=2)
+
+        self.assertIn("Cleaned 1 readings, 1 points, 1 devices", output)
+        self._assert_tables_empty()
+
+
+class TestRunVirtualDevicesStart(BaseTestCase):
+    @patch("discovery.management.commands.run_virtual_devices.BAC0")
+    def test_start_devices_records_results_on_main_thread(self, mock_bac0):
+        ok = VirtualBACnetDevice.objects.create(device_id=901, device_name="ok")
+        bad = VirtualBACnetDevice.objects.create(
+            device_id=902, device_name="bad", port=47809
+        )
+        bacnet = Mock()
+
+        def lite(deviceId, port):
+            if deviceId == bad.device_id:
+                raise OSError("port in use")
+            return bacnet
+
+        mock_bac0.lite.side_effect = lite
+        command = RunVirtualDevicesCommand()
+        command.stdout = out = StringIO()
+
+        command.start_devices([ok, bad])
+
+        self.assertEqual(command.running_devices, {ok.device_id: bacnet})
+        bad.refresh_from_db()
+        self.assertFalse(bad.is_running)
+        output = out.getvalue()
+        self.assertIn("Device 901 started on port 47808", output)
+        self.assertIn("Failed to start device 902: port in use", output)
+
+
+class TestCollectReadingsCommand(BaseTestCase):
+    @patch("discovery.services.BAC0")
+    def test_devices_option_reads_only_listed_online_devices(self, mock_bac0):
+        listed = BACnetDeviceFactory(device_id=7001, is_online=True)
+        BACnetDeviceFactory(device_id=7002, is_online=True)
+        BACnetDeviceFactory(device_id=7003, is_online=False)
+        out = StringIO()
+
+        with patch("discovery.services.BACnetService.read_device_points") as mock_read:
+            call_command("collect_readings", devices="7001, 7003", stdout=out)
+
+        read_ids = [call.args[0].device_id for call in mock_read.call_args_list]
+        self.assertEqual(read_ids, [listed.device_id])
+        self.assertIn("Devices successful: 1", out.getvalue())
+        self.assertIn("Devices failed: 0", out.getvalue())
@@ -0,0 +1,43 @@
+import json
+
+from django.test import SimpleTestCase
+
+from discovery.exceptions import (
+    DeviceNotFoundAPIError,
+    ValidationError,
+    _error_body_prefix,
+)
+
+
+class TestAPIErrorResponse(SimpleTestCase):
+    def setUp(self):
+        _error_body_prefix.cache_clear()
+
+    def test_response_body(self):
+        response = ValidationError("Invalid period 'x'").to_response()
+
+        self.assertEqual(response.status_code, 400)
+        data = json.loads(response.content)
+        self.assertFalse(data["success"])
+        self.assertEqual(
+            data["error"],
+            {
+                "code": "VALIDATION_ERROR",
+                "message": "Invalid period 'x'",
+                "type": "ValidationError",
+            },
+        )
+        self.assertIn("timestamp", data)
+
+    def test_instance_messages_are_not_cached(self):
+        for period in ("a", "b", "c"):
+            ValidationError(f"Invalid period '{period}'").to_response()
+
+        self.assertEqual(_error_body_prefix.cache_info().currsize, 0)
+
+    def test_class_messages_are_cached(self):
+        DeviceNotFoundAPIError().to_response()
+        DeviceNotFoundAPIError().to_response()
+
+        info = _error_body_prefix.cache_info()
+        self.assertEqual((info.currsize, info.hits), (1, 1))
@@ -0,0 +1,37 @@
+from django.test import TestCase
+
+from discovery.forms import VirtualDeviceCreateForm
+from discovery.models import VirtualBACnetDevice
+
+
+class TestVirtualDeviceCreateForm(TestCase):
+    def _form(self, **overrides):
+        data = {"device_id": 999, "device_name": "Virtual AHU", "port": 47808}
+        data.update(overrides)
+        return VirtualDeviceCreateForm(data=data)
+
+    def test_valid_data(self):
+        self.assertTrue(self._form().is_valid())
+
+    def test_device_id_out_of_range(self):
+        for device_id in (-1, 4194304):
+            form = self._form(device_id=device_id)
+            self.assertFalse(form.is_valid())
+            self.assertEqual(
+                form.errors["device_id"], ["Device ID must be between 0 and 4194303"]
+            )
+
+    def test_port_out_of_range(self):
+        for port in (80, 65536):
+            form = self._form(port=port)
+            self.assertFalse(form.is_valid())
+            self.assertEqual(
+                form.errors["port"], ["Port must be between 1024 and 65535"]
+            )
+
+    def test_duplicate_device_id_is_left_to_the_database(self):
+        VirtualBACnetDevice.objects.create(device_id=999, device_name="Existing")
+
+        form = self._form()
+        with self.assertNumQueries(0):
+            self.assertTrue(form.is_valid())
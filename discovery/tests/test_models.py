@@ -0,0 +1,74 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.db import connection
+
+from discovery.models import BACnetReading
+
+from .test_base import BaseTestCase
+
+
+class TestBACnetReadingValueNum(BaseTestCase):
+    def test_numeric_value_is_stored_as_float(self):
+        reading = BACnetReading.objects.create(point=self.point, value="21.5")
+        self.assertEqual(reading.value_num, 21.5)
+
+    def test_non_numeric_value_leaves_value_num_null(self):
+        for value in ("active", "nan", ""):
+            reading = BACnetReading.objects.create(point=self.point, value=value)
+            self.assertIsNone(reading.value_num)
+
+    def test_editing_value_recomputes_value_num(self):
+        reading = BACnetReading.objects.create(point=self.point, value="21.5")
+
+        reading.value = "inactive"
+        reading.save(update_fields=["value"])
+        reading.refresh_from_db()
+        self.assertIsNone(reading.value_num)
+
+        reading.value = "18"
+        reading.save()
+        reading.refresh_from_db()
+        self.assertEqual(reading.value_num, 18.0)
+
+    def test_backfill_migration_populates_value_num(self):
+        migration = import_module("discovery.migrations.0011_bacnetreading_value_num")
+        BACnetReading.objects.create(point=self.point, value="21.5")
+        BACnetReading.objects.create(point=self.point, value="1e-400")
+        BACnetReading.objects.create(point=self.point, value="active")
+        BACnetReading.objects.update(value_num=None)
+
+        migration.populate_value_num(apps, connection.schema_editor())
+
+        self.assertEqual(
+            dict(BACnetReading.objects.values_list("value", "value_num")),
+            {"21.5": 21.5, "1e-400": 0.0, "active": None},
+        )
+
+
+class TestBACnetPointDisplayValue(BaseTestCase):
+    def test_empty_value_displays_na(self):
+        self.point.present_value = ""
+        self.assertEqual(self.point.get_display_value(), "N/A")
+
+    def test_decimal_value_is_rounded(self):
+        self.point.present_value = "21.456"
+        self.point.units = ""
+        self.assertEqual(self.point.get_display_value(), "21.46")
+
+    def test_non_numeric_value_with_dot_is_kept(self):
+        self.point.present_value = "v1.2.3"
+        self.point.units = ""
+        self.assertEqual(self.point.get_display_value(), "v1.2.3")
+
+
+class TestBACnetPointUpdateValue(BaseTestCase):
+    def test_update_value_saves_only_changed_fields(self):
+        self.point.object_name = "unsaved name"
+        self.point.update_value(22.5, units="degreesCelsius")
+
+        self.point.refresh_from_db()
+        self.assertEqual(self.point.present_value, "22.5")
+        self.assertEqual(self.point.units, "degreesCelsius")
+        self.assertIsNotNone(self.point.value_last_read)
+        self.assertNotEqual(self.point.object_name, "unsaved name")
@@ -0,0 +1,73 @@
+from unittest.mock import Mock, patch
+
+from discovery.models import BACnetDevice, DeviceStatusHistory
+from discovery.services import BACnetService
+
+from .test_base import BaseTestCase
+
+MOCK_DEVICE_IDS = [123, 456]
+
+
+class TestDiscoverDevicesUpsert(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.service = BACnetService()
+
+    def test_mock_discovery_creates_devices_and_history(self):
+        self.service.discover_devices(mock_mode=True)
+
+        devices = BACnetDevice.objects.filter(device_id__in=MOCK_DEVICE_IDS)
+        self.assertEqual(devices.count(), 2)
+        self.assertEqual(
+            DeviceStatusHistory.objects.filter(device__in=devices).count(), 2
+        )
+
+    def test_second_discovery_updates_rows_in_place(self):
+        self.service.discover_devices(mock_mode=True)
+        first = {
+            device.device_id: device
+            for device in BACnetDevice.objects.filter(device_id__in=MOCK_DEVICE_IDS)
+        }
+        BACnetDevice.objects.filter(device_id=123).update(
+            address="10.0.0.1", is_online=False, is_active=False
+        )
+
+        self.service.discover_devices(mock_mode=True)
+
+        devices = BACnetDevice.objects.filter(device_id__in=MOCK_DEVICE_IDS)
+        self.assertEqual(devices.count(), 2)
+        for device in devices:
+            self.assertEqual(device.pk, first[device.device_id].pk)
+            self.assertTrue(device.is_online)
+            self.assertTrue(device.is_active)
+            self.assertGreaterEqual(device.last_seen, first[device.device_id].last_seen)
+        self.assertEqual(devices.get(device_id=123).address, "192.168.1.100")
+        self.assertEqual(
+            DeviceStatusHistory.objects.filter(device__in=devices).count(), 4
+        )
+
+    @patch("discovery.services.BAC0")
+    def test_real_discovery_upserts_existing_and_new_devices(self, mock_bac0):
+        mock_bac0.lite.return_value = Mock(
+            discover=Mock(
+                return_value=[
+                    ("10.0.0.5", self.device.device_id),
+                    ("10.0.0.6", 99001),
+                ]
+            )
+        )
+        original_pk = self.device.pk
+
+        self.service.discover_devices()
+
+        self.device.refresh_from_db()
+        self.assertEqual(self.device.pk, original_pk)
+        self.assertEqual(self.device.address, "10.0.0.5")
+        self.assertEqual(self.device.vendor_id, 123)
+        self.assertTrue(BACnetDevice.objects.filter(device_id=99001).exists())
+        self.assertEqual(
+            DeviceStatusHistory.objects.filter(
+                device__device_id__in=[self.device.device_id, 99001]
+            ).count(),
+            2,
+        )
@@ -6,7 +6,7 @@ from django.test import Client, RequestFactory
 from django.urls import reverse
 from django.utils import timezone
 
-from discovery.models import BACnetDevice
+from discovery.models import BACnetDevice, BACnetReading
 from discovery.views import (
     _build_device_context,
     _organise_points_by_type,
@@ -235,6 +235,34 @@ class TestDeviceTrendsAPI(BaseTestCase):
         self.assertEqual(data["device_id"], self.device.device_id)
         self.assertEqual(data["period"], "24hours")
 
+    def test_device_trends_numeric_values_and_count(self):
+        """Non-numeric readings come back as null and are left out of count"""
+        point = BACnetPointFactory(device=self.device)
+        now = timezone.now()
+        for minutes_ago, value in ((3, "21.5"), (2, "22.5"), (1, "active")):
+            BACnetReading.objects.create(
+                point=point, value=value, read_time=now - timedelta(minutes=minutes_ago)
+            )
+
+        for url in (
+            f"/api/devices/{self.device.device_id}/analytics/trends/",
+            f"/api/v2/devices/{self.device.device_id}/trends/",
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(
+                    url, {"period": "24hours", "points": point.identifier}
+                )
+                self.assertEqual(response.status_code, 200)
+                (point_info,) = json.loads(response.content)["points"]
+                self.assertEqual(
+                    [reading["value"] for reading in point_info["readings"]],
+                    [21.5, 22.5, None],
+                )
+                self.assertEqual(
+                    point_info["statistics"],
+                    {"min": 21.5, "max": 22.5, "avg": 22.0, "count": 2},
+                )
+
     def test_device_trends_invalid_period(self):
         """Test device trends API call with invalid period parameter"""
         response = self.client.get(
@@ -328,3 +356,34 @@ class TestDeviceStatusAPI(BaseTestCase):
         """Test that device status API only accepts GET requests"""
         response = self.client.post("/api/devices/status/")
         self.assertEqual(response.status_code, 200)
+
+
+class TestAPIRateLimit(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+
+    @patch("django_ratelimit.decorators.is_ratelimited", return_value=True)
+    def test_limited_request_gets_429_before_view_runs(self, mock_limited):
+        with patch("discovery.views.BACnetDevice.objects.filter") as mock_filter:
+            response = self.client.get("/api/devices/status/")
+
+        self.assertEqual(response.status_code, 429)
+        data = json.loads(response.content)
+        self.assertFalse(data["success"])
+        self.assertEqual(data["error"]["code"], "RATE_LIMIT_EXCEEDED")
+        mock_filter.assert_not_called()
+
+    @patch("django_ratelimit.decorators.is_ratelimited", return_value=False)
+    def test_error_handler_inside_rate_limit_returns_json_error(self, mock_limited):
+        with patch(
+            "discovery.views.BACnetDevice.objects.filter",
+            side_effect=RuntimeError("boom"),
+        ):
+            response = self.client.get("/api/devices/status/")
+
+        self.assertEqual(response.status_code, 500)
+        data = json.loads(response.content)
+        self.assertFalse(data["success"])
+        self.assertEqual(data["error"]["code"], "INTERNAL_ERROR")
+        self.assertIn("request_id", data["error"])
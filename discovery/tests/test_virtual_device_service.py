@@ -0,0 +1,24 @@
+from django.db import IntegrityError
+from django.test import TestCase
+
+from discovery.models import VirtualBACnetDevice
+from discovery.virtual_device_service import VirtualDeviceService
+
+
+class TestCreateVirtualDevice(TestCase):
+    def test_creates_running_device(self):
+        device = VirtualDeviceService.create_virtual_device(999, "Virtual AHU")
+
+        self.assertTrue(device.is_running)
+        self.assertEqual(device.port, 47808)
+
+    def test_duplicate_device_id_raises_value_error(self):
+        VirtualDeviceService.create_virtual_device(999, "Virtual AHU")
+
+        with self.assertRaisesMessage(ValueError, "Device ID 999 already exists"):
+            VirtualDeviceService.create_virtual_device(999, "Another AHU")
+        self.assertEqual(VirtualBACnetDevice.objects.filter(device_id=999).count(), 1)
+
+    def test_other_integrity_errors_are_not_reported_as_duplicates(self):
+        with self.assertRaises(IntegrityError):
+            VirtualDeviceService.create_virtual_device(999, None)
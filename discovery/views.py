@@ -18,8 +18,7 @@ from datetime import timedelta
 from typing import Any, Dict, List
 
 from django.contrib import messages
-from django.db.models import Avg, Count, FloatField, Max, Min
-from django.db.models.functions import Cast
+from django.db.models import Avg, Count, Max, Min
 from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
@@ -53,7 +52,7 @@ def create_error_response(error: Exception, user_friendly: bool = True) -> JsonR
     else:
         message = "An unexpected error occurred"
 
-    logger.error(f"API Error: {error}")
+    logger.error("API Error: %s", error)
     return JsonResponse(
         {
             "success": False,
@@ -63,11 +62,6 @@ def create_error_response(error: Exception, user_friendly: bool = True) -> JsonR
     )
 
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -125,7 +119,7 @@ def read_device_point_values(request: HttpRequest, device_id: int) -> JsonRespon
     if request.method == "POST":
         try:
             device = get_object_or_404(BACnetDevice, device_id=device_id)
-            logger.debug(f"device_ID: {device.device_id}")
+            logger.debug("device_ID: %s", device.device_id)
             service = BACnetService()
 
             results = service._initialise_results()
@@ -147,7 +141,7 @@ def read_device_point_values(request: HttpRequest, device_id: int) -> JsonRespon
                 }
             )
         except Exception as e:
-            logger.error(f"Error: {e}")
+            logger.error("Error: %s", e)
             return JsonResponse({"success": False, "message": str(e)})
 
     return JsonResponse({"success": False, "message": "Invalid request"})
@@ -158,7 +152,7 @@ def discover_device_points(request: HttpRequest, device_id: int) -> JsonResponse
     if request.method == "POST":
         try:
             device = get_object_or_404(BACnetDevice, device_id=device_id)
-            logger.debug(f"device_ID: {device.device_id}")
+            logger.debug("device_ID: %s", device.device_id)
             service = BACnetService()
             point_list = service.discover_device_points(device)
 
@@ -183,7 +177,7 @@ def discover_device_points(request: HttpRequest, device_id: int) -> JsonResponse
                     }
                 )
         except Exception as e:
-            logger.error(f"Error: {e}")
+            logger.error("Error: %s", e)
             return JsonResponse({"success": False, "message": str(e)})
 
     return JsonResponse({"success": False, "message": "Invalid request"})
@@ -213,7 +207,7 @@ def start_discovery(request: HttpRequest) -> JsonResponse:
                     }
                 )
         except Exception as e:
-            logger.error(f"Error: {e}")
+            logger.error("Error: %s", e)
             return JsonResponse({"success": False, "message": str(e)})
 
     return JsonResponse({"success": False, "message": "Invalid request"})
@@ -249,7 +243,7 @@ def read_single_point_value(
             )
 
         except Exception as e:
-            logger.error(f"Error: {e}")
+            logger.error("Error: %s", e)
             return JsonResponse({"success": False, "message": str(e)})
 
     return JsonResponse({"success": False, "message": "Invalid request"})
@@ -440,20 +434,22 @@ def device_trends_api(request: HttpRequest, device_id: int) -> JsonResponse:
         for point in points:
             readings = point.readings.filter(read_time__gte=start_time)
             stats = readings.aggregate(
-                min_value=Min(Cast("value", FloatField())),
-                max_value=Max(Cast("value", FloatField())),
-                avg_value=Avg(Cast("value", FloatField())),
-                count=Count("id"),
+                min_value=Min("value_num"),
+                max_value=Max("value_num"),
+                avg_value=Avg("value_num"),
+                count=Count("value_num"),
             )
             points_info.append(
                 {
                     "point_identifier": point.identifier,
                     "readings": [
                         {
-                            "timestamp": r.read_time.isoformat(),
-                            "value": float(r.value) if r.value else None,
+                            "timestamp": read_time.isoformat(),
+                            "value": value,
                         }
-                        for r in readings.order_by("read_time")
+                        for read_time, value in readings.order_by(
+                            "read_time"
+                        ).values_list("read_time", "value_num")
                     ],
                     "statistics": {
                         "min": (
@@ -517,7 +513,7 @@ def virtual_device_create(request: HttpRequest) -> HttpResponse:
                 return redirect("discovery:virtual_device_list")
 
             except ValueError as e:
-                messages.error(request, str(e))
+                form.add_error("device_id", str(e))
 
     else:
         form = VirtualDeviceCreateForm()
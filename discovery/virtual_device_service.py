@@ -6,6 +6,8 @@ Handles creation, deletion, and management of virtual BACnet devices
 
 import logging
 
+from django.db import IntegrityError, transaction
+
 from .models import VirtualBACnetDevice
 
 logger = logging.getLogger(__name__)
@@ -32,20 +34,27 @@ class VirtualDeviceService:
             ValueError: If device_id already exists
         """
 
-        # Check if device_id already exists
-        if VirtualBACnetDevice.objects.filter(device_id=device_id).exists():
-            raise ValueError(f"Device ID {device_id} already exists")
-
-        # Create device in database
-        device = VirtualBACnetDevice.objects.create(
-            device_id=device_id,
-            device_name=device_name,
-            description=description,
-            port=port,
-            is_running=True,
-        )
-
-        logger.info(f"Virtual device created: {device_id} - {device_name}")
+        # The unique constraint on device_id rejects duplicates; the
+        # existence check only runs once an insert has already failed
+        try:
+            with transaction.atomic():
+                device = VirtualBACnetDevice.objects.create(
+                    device_id=device_id,
+                    device_name=device_name,
+                    description=description,
+                    port=port,
+                    is_running=True,
+                )
+        except IntegrityError:
+            # Only a clash on device_id is a user error; anything else
+            # (NOT NULL, bad data) is a bug and should surface as is
+            if not VirtualBACnetDevice.objects.filter(device_id=device_id).exists():
+                raise
+            raise ValueError(
+                f"Device ID {device_id} already exists. Please choose a different ID."
+            )
+
+        logger.info("Virtual device created: %s - %s", device_id, device_name)
         return device
 
     @staticmethod
@@ -65,10 +74,10 @@ class VirtualDeviceService:
             device.save()
             device.delete()
 
-            logger.info(f"Virtual device deleted: {device_id}")
+            logger.info("Virtual device deleted: %s", device_id)
             return True
         except VirtualBACnetDevice.DoesNotExist:
-            logger.warning(f"Device {device_id} not found")
+            logger.warning("Device %s not found", device_id)
             return False
 
     @staticmethod
@@ -87,7 +96,7 @@ class VirtualDeviceService:
             device = VirtualBACnetDevice.objects.get(device_id=device_id)
             device.is_running = True
             device.save()
-            logger.info(f"Virtual device marked for start: {device_id}")
+            logger.info("Virtual device marked for start: %s", device_id)
             return True
         except VirtualBACnetDevice.DoesNotExist:
             return False
@@ -107,7 +116,7 @@ class VirtualDeviceService:
             device = VirtualBACnetDevice.objects.get(device_id=device_id)
             device.is_running = False
             device.save()
-            logger.info(f"Virtual device marked for stop: {device_id}")
+            logger.info("Virtual device marked for stop: %s", device_id)
             return True
         except VirtualBACnetDevice.DoesNotExist:
             return False